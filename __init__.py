@@ -18,93 +18,140 @@ bl_info = {
 }
 
 import bpy
-import os
-import addon_utils
 from bpy.types import Operator
-import json
+from bpy.props import BoolProperty
 
-def combine_vertex_group(v1, v2):
-    bpy.ops.object.modifier_add(type='VERTEX_WEIGHT_MIX')
-    bpy.ops.object.modifier_move_to_index(modifier="VertexWeightMix", index=0)
-    bpy.context.object.modifiers[0].name = v1
-    bpy.context.object.modifiers[0].vertex_group_a = v1
-    bpy.context.object.modifiers[0].vertex_group_b = v2
-    bpy.context.object.modifiers[0].mix_mode = 'ADD'
-    bpy.context.object.modifiers[0].mix_set = 'ALL'
-    bpy.ops.object.modifier_apply(modifier=v1)
+__all__ = ("register", "unregister")
+
+def load_vertex_group_map():
+    # the remap table lives in a sibling module, imported on first use
+    # so enabling the addon doesn't pay for it
+    from .daz_to_arp_vertexgroups import DAZ_TO_ARP_VERTEXGROUPS
+    return DAZ_TO_ARP_VERTEXGROUPS
+
+# some bones are unavailable in ARP
+# so their groups are merged into the adjacent bone's group
+MERGE_GROUPS = (
+    ("foot.l", "lMetatarsals"),
+    ("foot.r", "rMetatarsals"),
+    ("spine_03.x", "chestUpper"),
+)
+
+def combine_vertex_groups(obj, merges):
+    # add the weights of each source group onto its target group and drop the source
+    # done directly on the groups, a weight mix modifier re-evaluates the whole object on apply
+    vgs = obj.vertex_groups
+    # source group index -> (target group, vertex indices, weights)
+    pending = {vgs[src].index: (vgs[dst], [], []) for dst, src in merges}
+
+    # one walk over the vertices for all merges
+    # gather first, adding to a target while walking v.groups would resize it
+    for v in obj.data.vertices:
+        for g in v.groups:
+            p = pending.get(g.group)
+            if p is not None and g.weight > 0.0:
+                p[1].append(v.index)
+                p[2].append(g.weight)
+
+    # VertexGroup.add takes one weight per call
+    for dst, idx, w in pending.values():
+        for i, wi in zip(idx, w):
+            dst.add([i], wi, 'ADD')
+    for dst, src in merges:
+        vgs.remove(vgs[src])
 
 
 class Daz2arp_vertex_group_remap(bpy.types.Operator):
     """Remap Daz vertex group to AutoRig Pro"""
     bl_idname = "mesh.daz2arp_vertex_group_remap"
     bl_label = "Daz to ARP"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    report_missing: BoolProperty(
+        name="Report Missing",
+        description="Warn about mapped or merged Daz vertex groups that are not found on a mesh",
+        default=False,
+    )
                 
     @classmethod
     def poll(cls, context):
-        return context.active_object is not None
+        # vertex group weights can't be written while a mesh is in edit mode
+        return context.active_object is not None and context.mode == 'OBJECT'
 
     def execute(self, context):
-        # load remap definition from json file
-        file_name = "daz_to_arp_vertexgroups.json"
-        
-        for mod in addon_utils.modules():
-            if mod.bl_info['name'] == "Daz2ARP":
-                filepath = mod.__file__
-            
-        absPath = os.path.dirname(filepath)+"\\"+file_name
-        
-        with open(absPath) as f:
-            vg = json.load(f)
-
-        newName = "Blah"
-
-        # remap each vertex group
+        vg = load_vertex_group_map()
+
+        # remap and merge in one pass over each mesh
         for m in bpy.context.selected_objects:
-            if m.type == 'MESH':
-                for i in vg:
-                    newName = vg[i]
-                    try:
-                        m.vertex_groups[i].name = newName
-                        m.vertex_groups[newName].lock_weight = True
-                        txt = "changed vertex group "+i+" to "+newName
-                        self.report({'INFO'}, txt)
-                    except:
-                        self.report({'INFO'}, "vertext group "+i+" not found in this object")
-        
-        # some bones are unavailable in ARP
-        # so merge them with adjacent bones
-        try:
-            combine_vertex_group("foot.l", "lMetatarsals")
-        except:
-            self.report({'INFO'}, "lMetatarsals not merged")
-            bpy.ops.object.modifier_remove(modifier="foot.l")
-            
-        try:
-            combine_vertex_group("foot.r", "rMetatarsals")
-        except:
-            self.report({'INFO'}, "rMetatarsals not merged")
-            bpy.ops.object.modifier_remove(modifier="foot.r")
-            
-        try:
-            combine_vertex_group("spine_03.x", "chestUpper")
-        except:
-            self.report({'INFO'}, "chestUpper not merged")
-            bpy.ops.object.modifier_remove(modifier="spine_03.x")
-            
+            if m.type != 'MESH':
+                continue
+
+            # look groups up by name once instead of raising on every miss
+            vgs = m.vertex_groups
+            existing = {g.name: g for g in vgs}
+            # only visit the Daz names this mesh actually has,
+            # meshes without any (clothing, hair) skip the loop entirely
+            present = existing.keys() & vg.keys()
+            for i in present:
+                newName = vg[i]
+                # renaming keeps the reference valid, no second lookup needed
+                existing[i].name = newName
+                if bpy.app.debug:
+                    print("changed vertex group "+i+" to "+newName)
+            if present:
+                # lock the renamed groups in one bulk write
+                locks = [False] * len(vgs)
+                vgs.foreach_get("lock_weight", locks)
+                for i in present:
+                    locks[existing[i].index] = True
+                vgs.foreach_set("lock_weight", locks)
+            missing = len(vg) - len(present)
+            if self.report_missing and missing:
+                not_found = ", ".join(sorted(vg.keys() - present))
+                self.report({'WARNING'}, f"vertex groups not found in {m.name}: {not_found}")
+            # one report per mesh rather than one per group
+            self.report({'INFO'}, f"{m.name}: renamed {len(present)}, missing {missing}")
+
+            # group names after the renames, without walking vertex_groups again
+            names = (existing.keys() - present) | {vg[i] for i in present}
+            # merge only where the source group exists (eyes, lashes, clothing usually have none)
+            merges = []
+            not_merged = []
+            for a, b in MERGE_GROUPS:
+                if b not in names:
+                    not_merged.append(b)
+                elif a in names:
+                    merges.append((a, b))
+                else:
+                    # nothing to merge into, the source group simply becomes the target
+                    g = existing[b]
+                    g.name = a
+                    g.lock_weight = True
+            if merges:
+                combine_vertex_groups(m, merges)
+            if self.report_missing and not_merged:
+                self.report({'WARNING'}, f"vertex groups not merged in {m.name}: {', '.join(not_merged)}")
+
         return {'FINISHED'}
 
 def menu_func(self, context):
     self.layout.operator(Daz2arp_vertex_group_remap.bl_idname, text=Daz2arp_vertex_group_remap.bl_label)
 
+_classes = (
+    Daz2arp_vertex_group_remap,
+)
+
 # Register and add to the "object" menu (required to also use F3 search "Simple Object Operator" for quick access)
 def register():
-    bpy.utils.register_class(Daz2arp_vertex_group_remap)
+    for cls in _classes:
+        bpy.utils.register_class(cls)
     bpy.types.VIEW3D_MT_object.append(menu_func)
 
 
 def unregister():
-    bpy.utils.unregister_class(Daz2arp_vertex_group_remap)
     bpy.types.VIEW3D_MT_object.remove(menu_func)
+    for cls in reversed(_classes):
+        bpy.utils.unregister_class(cls)
 
 
 if __name__ == "__main__":
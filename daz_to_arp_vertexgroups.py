@@ -0,0 +1,99 @@
+# Daz vertex group name -> AutoRig Pro vertex group name
+# body parts only, facial groups are left to FaceIt
+
+from types import MappingProxyType
+
+# read-only view, the table is shared by every run of the operator
+DAZ_TO_ARP_VERTEXGROUPS = MappingProxyType({
+    "pelvis": "root.x",
+    "lThighBend": "thigh_twist.l",
+    "lThighTwist": "thigh_stretch.l",
+    "lShin": "leg_stretch.l",
+    "lFoot": "foot.l",
+    "lToe": "toes_01.l",
+    "lSmallToe4": "c_toes_pinky2.l",
+    "lSmallToe4_2": "c_toes_pinky3.l",
+    "lSmallToe3": "c_toes_ring2.l",
+    "lSmallToe3_2": "c_toes_ring3.l",
+    "lSmallToe2": "c_toes_middle2.l",
+    "lSmallToe2_2": "c_toes_middle3.l",
+    "lSmallToe1": "c_toes_index2.l",
+    "lSmallToe1_2": "c_toes_index3.l",
+    "lBigToe": "c_toes_thumb1.l",
+    "lBigToe_2": "c_toes_thumb2.l",
+    "rThighBend": "thigh_twist.r",
+    "rThighTwist": "thigh_stretch.r",
+    "rShin": "leg_stretch.r",
+    "rFoot": "foot.r",
+    "rToe": "toes_01.r",
+    "rSmallToe4": "c_toes_pinky2.r",
+    "rSmallToe4_2": "c_toes_pinky3.r",
+    "rSmallToe3": "c_toes_ring2.r",
+    "rSmallToe3_2": "c_toes_ring3.r",
+    "rSmallToe2": "c_toes_middle2.r",
+    "rSmallToe2_2": "c_toes_middle3.r",
+    "rSmallToe1": "c_toes_index2.r",
+    "rSmallToe1_2": "c_toes_index3.r",
+    "rBigToe": "c_toes_thumb1.r",
+    "rBigToe_2": "c_toes_thumb2.r",
+    "abdomenLower": "spine_01.x",
+    "abdomenUpper": "spine_02.x",
+    "chestLower": "spine_03.x",
+    "lCollar": "shoulder.l",
+    "lShldrBend": "c_arm_twist_offset.l",
+    "lShldrTwist": "arm_stretch.l",
+    "lForearmBend": "forearm_stretch.l",
+    "lForearmTwist": "forearm_twist.l",
+    "lHand": "hand.l",
+    "lThumb1": "thumb1.l",
+    "lThumb2": "c_thumb2.l",
+    "lThumb3": "c_thumb3.l",
+    "lCarpal1": "c_index1_base.l",
+    "lIndex1": "index1.l",
+    "lIndex2": "c_index2.l",
+    "lIndex3": "c_index3.l",
+    "lCarpal2": "c_middle1_base.l",
+    "lMid1": "middle1.l",
+    "lMid2": "c_middle2.l",
+    "lMid3": "c_middle3.l",
+    "lCarpal3": "c_ring1_base.l",
+    "lRing1": "ring1.l",
+    "lRing2": "c_ring2.l",
+    "lRing3": "c_ring3.l",
+    "lCarpal4": "c_pinky1_base.l",
+    "lPinky1": "pinky1.l",
+    "lPinky2": "c_pinky2.l",
+    "lPinky3": "c_pinky3.l",
+    "rCollar": "shoulder.r",
+    "rShldrBend": "c_arm_twist_offset.r",
+    "rShldrTwist": "arm_stretch.r",
+    "rForearmBend": "forearm_stretch.r",
+    "rForearmTwist": "forearm_twist.r",
+    "rHand": "hand.r",
+    "rThumb1": "thumb1.r",
+    "rThumb2": "c_thumb2.r",
+    "rThumb3": "c_thumb3.r",
+    "rCarpal1": "c_index1_base.r",
+    "rIndex1": "index1.r",
+    "rIndex2": "c_index2.r",
+    "rIndex3": "c_index3.r",
+    "rCarpal2": "c_middle1_base.r",
+    "rMid1": "middle1.r",
+    "rMid2": "c_middle2.r",
+    "rMid3": "c_middle3.r",
+    "rCarpal3": "c_ring1_base.r",
+    "rRing1": "ring1.r",
+    "rRing2": "c_ring2.r",
+    "rRing3": "c_ring3.r",
+    "rCarpal4": "c_pinky1_base.r",
+    "rPinky1": "pinky1.r",
+    "rPinky2": "c_pinky2.r",
+    "rPinky3": "c_pinky3.r",
+    "neckLower": "c_subneck_1.x",
+    "neckUpper": "neck.x",
+    "head": "head.x",
+    "lEar": "c_ear_01.l",
+    "rEar": "c_ear_01.r",
+    "lPectoral": "c_breast_01.l",
+    "rPectoral": "c_breast_01.r",
+})